@@ -1,12 +1,18 @@
 """
 Documentation loader module for loading DOCS.md content.
 """
+from functools import lru_cache
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
+
+@lru_cache(maxsize=None)
 def load_docs(docs_file: str = "DOCS.md") -> str:
     """
     Load documentation content from a markdown file.
+    The file is looked up in the project root first, then in the current
+    working directory. The result is cached per docs_file.
 
     Args:
         docs_file: Path to the documentation file (default: "DOCS.md")
@@ -15,17 +21,10 @@ def load_docs(docs_file: str = "DOCS.md") -> str:
         Documentation content as string, or fallback content if file not found.
     """
     try:
-        current_dir = Path.cwd()
-        docs_path = current_dir / docs_file
+        docs_path = PROJECT_ROOT / docs_file
 
         if not docs_path.exists():
-            for i in range(3):
-                parent_dir = current_dir.parents[i] if i < len(current_dir.parents) else None
-                if parent_dir:
-                    potential_path = parent_dir / docs_file
-                    if potential_path.exists():
-                        docs_path = potential_path
-                        break
+            docs_path = Path.cwd() / docs_file
 
         # Read the documentation file
         if docs_path.exists():
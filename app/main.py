@@ -1,9 +1,20 @@
+import logging
+
 from fastapi import FastAPI
 from app.routes import webhooks
-from app.settings import settings
-from app.webhooks.loader import load_plugins
+from app.settings import get_settings
+from app.webhooks.events import events
+from app.webhooks.loader import load_plugins, load_entry_point_plugins
+
+settings = get_settings()
+
+logging.basicConfig(level=settings.LOG_LEVEL)
+
+events.sequential = settings.SEQUENTIAL_HANDLERS
 
-load_plugins(settings.PLUGIN_PATH)
+load_plugins(settings.PLUGIN_PATH, disabled=settings.disabled_plugins)
+load_entry_point_plugins(disabled=settings.disabled_plugins)
+events.freeze()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -14,4 +25,6 @@ app = FastAPI(
     openapi_url="/openapi.json",
 )
 
+# Do not pass dependencies= here or to FastAPI(): WebhookRoute never runs
+# them, so webhook auth must stay on the HMAC signature check.
 app.include_router(webhooks.router)
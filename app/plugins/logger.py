@@ -1,12 +1,14 @@
+import logging
+
 from app.webhooks.events import events
 from app.schemas.webhooks import OrderData
 from app.webhooks.events import WebhookMeta
 
-PLUGIN_ACTIVE = True
+log = logging.getLogger(__name__)
 
 @events.on("*")
 async def log_all_events(payload: OrderData, meta: WebhookMeta) -> None:
     event_name = meta.get("event", "unknown")
 
-    print(f"[{event_name}] Order ID: {payload.order_id}")
-    print(f"[{event_name}] Payload: {payload}")
+    log.info("[%s] Order ID: %s", event_name, payload.order_id)
+    log.debug("[%s] Payload: %s", event_name, payload)
@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Request, HTTPException
-from app import settings
+from operator import attrgetter
+from typing import NamedTuple, Type
+
+from fastapi import APIRouter, Request, HTTPException, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from app.settings import get_settings
 from app.webhooks import (
-    extract_webhook_data,
-    verify_signature,
+    extract_webhook_headers,
+    verify_signature_streaming,
     verify_timestamp,
     events,
     WebhookMeta,
@@ -16,211 +21,283 @@ from app.schemas.webhooks import (
     WebhookResponse,
 )
 
-router = APIRouter(
-    prefix="/ghala/webhook",
-    tags=["Webhooks"],
-    responses={404: {"description": "Not found"}},
-)
 
+class WebhookRouteSpec(NamedTuple):
+    """A webhook endpoint: its path, secret setting, event, payload model and docs."""
+    path: str
+    secret_attr: str
+    event_name: str
+    model: Type[BaseModel]
+    doc: str
 
-async def handle_webhook(request: Request, secret: str, event_name: str, model=None) -> WebhookResponse:
-    """
-    Generic webhook handler for all Ghala events.
 
-    This function:
+ROUTES = [
+    WebhookRouteSpec(
+        "/order-created",
+        "CREATE_ORDER_WEBHOOK_SECRET",
+        "order.created",
+        OrderCreatedWebhook,
+        """
+        Receive **Order Created** webhook from Ghala.
+
+        Triggered when:
+
+            A new order is successfully placed by a customer.
+
+        Payload includes:
+
+            - Customer details (name, phone, email).
+            - Order information (order ID, total amount, discounts).
+            - Line items (products purchased with quantity and pricing).
+
+        What this endpoint does:
+
+            - Verifies the request signature for authenticity.
+            - Dispatches an `order.created` event to your plugin system,
+              enabling custom logic such as database persistence, analytics,
+              or sending notifications.
+            - Returns a confirmation response to Ghala.
+        """,
+    ),
+    WebhookRouteSpec(
+        "/order-updated",
+        "UPDATE_ORDER_WEBHOOK_SECRET",
+        "order.updated",
+        OrderUpdatedWebhook,
+        """
+        Receive **Order Updated** webhook from Ghala.
+
+        Triggered when:
+
+            An existing order’s details are modified, such as product quantities,
+            applied discounts, or updated customer information.
+
+        Payload includes:
+
+            - Updated order metadata.
+            - Modified product line items.
+            - New totals (if applicable).
+
+        What this endpoint does:
+
+            - Validates and parses the update event.
+            - Dispatches an `order.updated` event for custom handling,
+              such as syncing with ERP/CRM systems or adjusting stock levels.
+            - Responds with acknowledgment to Ghala.
+        """,
+    ),
+    WebhookRouteSpec(
+        "/order-cancelled",
+        "CANCEL_ORDER_WEBHOOK_SECRET",
+        "order.cancelled",
+        OrderCancelledWebhook,
+        """
+        Receive **Order Cancelled** webhook from Ghala.
 
-    1. Extracts timestamp, signature, and body from the request.
-    2. Verifies the timestamp and HMAC signature to ensure authenticity.
-    3. Parses the payload using a Pydantic model if provided.
-    4. Dispatches the event to any registered plugin handlers.
-    5. Returns a standardized acknowledgment.
+        Triggered when:
 
-    Args:
-        request (Request): The raw HTTP request object from Ghala.
-        secret (str): Webhook secret for signature verification.
-        event_name (str): Name of the event to dispatch (e.g., "order.created").
-        model (Optional[PydanticModel]): Pydantic model to validate the incoming payload.
+            A customer or merchant cancels an existing order.
 
-    Returns:
-        WebhookResponse: A confirmation response indicating successful receipt.
+        Payload includes:
 
-    Raises:
-        HTTPException: If request verification fails or payload is invalid.
-    """
-    timestamp, signature, body = await extract_webhook_data(request)
+            - Cancelled order ID.
+            - Customer information.
+            - Reason for cancellation (if provided).
 
-    verify_timestamp(timestamp)
-    verify_signature(secret, timestamp, body, signature)
-
-    try:
-        json_body = body.decode("utf-8")
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON")
-
-    if model:
-        try:
-            payload = model.parse_raw(body)
-        except Exception as e:
-            raise HTTPException(status_code=422, detail=f"Invalid payload: {e}")
-    else:
-        payload = json_body
-
-    event_payload = getattr(payload, "data", payload)
-    meta: WebhookMeta = {"timestamp": timestamp, "event": event_name}
+        What this endpoint does:
 
-    await events.dispatch(event_name, event_payload, meta)
+            - Ensures authenticity of the cancellation request.
+            - Dispatches an `order.cancelled` event, enabling plugins to
+              handle refunds, restock inventory, or update reporting systems.
+            - Sends back acknowledgment to Ghala.
+        """,
+    ),
+    WebhookRouteSpec(
+        "/payment-successful",
+        "PAYMENT_SUCCESSFUL_WEBHOOK_SECRET",
+        "payment.successful",
+        PaymentSuccessfulWebhook,
+        """
+        Receive **Payment Successful** webhook from Ghala.
 
-    return WebhookResponse(message=f"{event_name} webhook received and verified")
+        Triggered when:
 
+            A customer’s payment for an order is processed successfully.
 
-@router.post("/order-created", response_model=WebhookResponse)
-async def order_created(request: Request):
-    """
-    Receive **Order Created** webhook from Ghala.
+        Payload includes:
 
-    Triggered when:
+            - Payment ID and method (e.g., card, mobile money).
+            - Amount paid.
+            - Associated order ID.
 
-        A new order is successfully placed by a customer.
+        What this endpoint does:
 
-    Payload includes:
+            - Confirms the payment authenticity.
+            - Dispatches a `payment.successful` event, allowing plugins to
+              activate subscriptions, update ledgers, or send confirmation messages.
+            - Returns success acknowledgment to Ghala.
+        """,
+    ),
+    WebhookRouteSpec(
+        "/payment-failed",
+        "PAYMENT_FAILED_WEBHOOK_SECRET",
+        "payment.failed",
+        PaymentFailedWebhook,
+        """
+        Receive **Payment Failed** webhook from Ghala.
 
-        - Customer details (name, phone, email).
-        - Order information (order ID, total amount, discounts).
-        - Line items (products purchased with quantity and pricing).
+        Triggered when:
 
-    What this endpoint does:
+            A customer’s payment attempt fails due to issues such as
+            insufficient funds, expired card, or gateway error.
 
-        - Verifies the request signature for authenticity.
-        - Dispatches an `order.created` event to your plugin system,
-          enabling custom logic such as database persistence, analytics,
-          or sending notifications.
-        - Returns a confirmation response to Ghala.
-    """
-    return await handle_webhook(
-        request,
-        secret=settings.settings.CREATE_ORDER_WEBHOOK_SECRET,
-        event_name="order.created",
-        model=OrderCreatedWebhook,
-    )
+        Payload includes:
+
+            - Failure reason.
+            - Payment ID (if generated).
+            - Associated order ID.
 
+        What this endpoint does:
 
-@router.post("/order-updated", response_model=WebhookResponse)
-async def order_updated(request: Request):
-    """
-    Receive **Order Updated** webhook from Ghala.
+            - Validates and verifies the failure event.
+            - Dispatches a `payment.failed` event to plugins, which can
+              notify the customer, retry payments, or flag the order for review.
+            - Responds with acknowledgment to Ghala.
+        """,
+    ),
+]
 
-    Triggered when:
+_GET_DATA = attrgetter("data")
 
-        An existing order’s details are modified, such as product quantities,
-        applied discounts, or updated customer information.
+_VALIDATORS = {
+    route.event_name: route.model.__pydantic_validator__.validate_json
+    for route in ROUTES
+}
 
-    Payload includes:
 
-        - Updated order metadata.
-        - Modified product line items.
-        - New totals (if applicable).
+def _encode_ack(event_name: str) -> bytes:
+    """Serialize the acknowledgment body returned for an event."""
+    ack = WebhookResponse(message=f"{event_name} webhook received and verified")
+    return ack.model_dump_json().encode("utf-8")
 
-    What this endpoint does:
 
-        - Validates and parses the update event.
-        - Dispatches an `order.updated` event for custom handling,
-          such as syncing with ERP/CRM systems or adjusting stock levels.
-        - Responds with acknowledgment to Ghala.
-    """
-    return await handle_webhook(
-        request,
-        secret=settings.settings.UPDATE_ORDER_WEBHOOK_SECRET,
-        event_name="order.updated",
-        model=OrderUpdatedWebhook,
-    )
+_ACKS = {route.event_name: _encode_ack(route.event_name) for route in ROUTES}
 
 
-@router.post("/order-cancelled", response_model=WebhookResponse)
-async def order_cancelled(request: Request):
+class WebhookRoute(APIRoute):
+    """
+    Route that calls the endpoint directly with the Request.
+
+    Webhook endpoints take only the Request and return a ready Response, so
+    FastAPI's per-request dependency solving and response serialization are
+    skipped. The route is still an APIRoute and stays in the OpenAPI schema.
+
+    Because dependencies are never solved, a route declared with
+    `dependencies=` (on the route or on this router) raises RuntimeError.
+    Dependencies added later through `include_router(..., dependencies=...)`
+    or `FastAPI(dependencies=...)` are NOT run for these routes either, so
+    auth for the webhooks must not rely on them; the HMAC signature check in
+    handle_webhook is the only gate. Both behaviours depend on FastAPI
+    internals, so requirements.txt pins the tested FastAPI range.
     """
-    Receive **Order Cancelled** webhook from Ghala.
 
-    Triggered when:
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if self.dependencies:
+            raise RuntimeError(f"{self.path}: WebhookRoute does not run dependencies")
 
-        A customer or merchant cancels an existing order.
+    def get_route_handler(self):
+        return self.endpoint
 
-    Payload includes:
 
-        - Cancelled order ID.
-        - Customer information.
-        - Reason for cancellation (if provided).
+router = APIRouter(
+    prefix="/ghala/webhook",
+    route_class=WebhookRoute,
+    tags=["Webhooks"],
+    responses={404: {"description": "Not found"}},
+)
 
-    What this endpoint does:
 
-        - Ensures authenticity of the cancellation request.
-        - Dispatches an `order.cancelled` event, enabling plugins to
-          handle refunds, restock inventory, or update reporting systems.
-        - Sends back acknowledgment to Ghala.
+async def handle_webhook(request: Request, secret: str, event_name: str, validate=None) -> Response:
     """
-    return await handle_webhook(
-        request,
-        secret=settings.settings.CANCEL_ORDER_WEBHOOK_SECRET,
-        event_name="order.cancelled",
-        model=OrderCancelledWebhook,
-    )
+    Generic webhook handler for all Ghala events.
 
+    This function:
+
+    1. Extracts and verifies the timestamp and signature headers before any
+       of the body is read.
+    2. Streams the body into the HMAC as it arrives to verify authenticity,
+       rejecting bodies larger than the allowed size. Nothing is parsed
+       until the signature checks out.
+    3. Parses the payload using a prebound Pydantic validator if provided.
+    4. Dispatches the event to any registered plugin handlers.
+    5. Returns a standardized acknowledgment, pre-encoded for known events.
 
-@router.post("/payment-successful", response_model=WebhookResponse)
-async def payment_successful(request: Request):
+    Args:
+        request (Request): The raw HTTP request object from Ghala.
+        secret (str): Webhook secret for signature verification.
+        event_name (str): Name of the event to dispatch (e.g., "order.created").
+        validate (Optional[Callable[[bytearray], BaseModel]]): Prebound ``validate_json``
+            of the Pydantic model used to validate the incoming payload. The model
+            must expose the event body as ``data``, which is what handlers receive.
+
+    Returns:
+        Response: A JSON ``WebhookResponse`` body confirming successful receipt.
+
+    Raises:
+        HTTPException: If request verification fails or payload is invalid.
     """
-    Receive **Payment Successful** webhook from Ghala.
+    timestamp, signature = extract_webhook_headers(request)
+    verify_timestamp(timestamp)
 
-    Triggered when:
+    body = await verify_signature_streaming(
+        secret, timestamp, request, signature, max_bytes=get_settings().MAX_BODY_BYTES
+    )
 
-        A customer’s payment for an order is processed successfully.
+    try:
+        if validate is not None:
+            payload = validate(body)
+        else:
+            payload = body.decode("utf-8")
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=f"Invalid payload: {e}")
+
+    event_payload = _GET_DATA(payload) if validate is not None else payload
+    meta: WebhookMeta = {"timestamp": timestamp, "event": event_name}
 
-    Payload includes:
+    await events.dispatch(event_name, event_payload, meta)
 
-        - Payment ID and method (e.g., card, mobile money).
-        - Amount paid.
-        - Associated order ID.
+    ack = _ACKS.get(event_name) or _encode_ack(event_name)
+    return Response(content=ack, media_type="application/json")
 
-    What this endpoint does:
 
-        - Confirms the payment authenticity.
-        - Dispatches a `payment.successful` event, allowing plugins to
-          activate subscriptions, update ledgers, or send confirmation messages.
-        - Returns success acknowledgment to Ghala.
+def _make_handler(secret_attr: str, event_name: str, doc: str):
     """
-    return await handle_webhook(
-        request,
-        secret=settings.settings.PAYMENT_SUCCESSFUL_WEBHOOK_SECRET,
-        event_name="payment.successful",
-        model=PaymentSuccessfulWebhook,
-    )
+    Build the endpoint for a single webhook route.
 
-
-@router.post("/payment-failed", response_model=WebhookResponse)
-async def payment_failed(request: Request):
+    The secret is read from settings on each request, and the payload
+    validator is bound once when the route is registered.
     """
-    Receive **Payment Failed** webhook from Ghala.
+    validate = _VALIDATORS[event_name]
 
-    Triggered when:
+    async def endpoint(request: Request):
+        return await handle_webhook(
+            request,
+            secret=getattr(get_settings(), secret_attr),
+            event_name=event_name,
+            validate=validate,
+        )
 
-        A customer’s payment attempt fails due to issues such as
-        insufficient funds, expired card, or gateway error.
+    endpoint.__name__ = event_name.replace(".", "_")
+    endpoint.__doc__ = doc
+    return endpoint
 
-    Payload includes:
 
-        - Failure reason.
-        - Payment ID (if generated).
-        - Associated order ID.
+def _register_routes() -> None:
+    """Add a POST endpoint to the router for each entry in ROUTES."""
+    for route in ROUTES:
+        endpoint = _make_handler(route.secret_attr, route.event_name, route.doc)
+        router.post(route.path, response_model=WebhookResponse)(endpoint)
 
-    What this endpoint does:
 
-        - Validates and verifies the failure event.
-        - Dispatches a `payment.failed` event to plugins, which can
-          notify the customer, retry payments, or flag the order for review.
-        - Responds with acknowledgment to Ghala.
-    """
-    return await handle_webhook(
-        request,
-        secret=settings.settings.PAYMENT_FAILED_WEBHOOK_SECRET,
-        event_name="payment.failed",
-        model=PaymentFailedWebhook,
-    )
+_register_routes()
@@ -1,18 +1,19 @@
 from typing import List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Customer(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     name: str
     phone: Optional[str] = None
     phone_number: Optional[str] = None
     email: Optional[str] = None
 
-    class Config:
-        extra = "ignore"
-
 
 class Product(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     id: Optional[int] = None
     name: str
     price: float
@@ -22,11 +23,10 @@ class Product(BaseModel):
     additional_cost_description: Optional[str] = None
     quantity: float
 
-    class Config:
-        extra = "ignore"
-
 
 class OrderData(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     customer: Customer
     order_id: int
     total: float
@@ -34,36 +34,32 @@ class OrderData(BaseModel):
     promo_discount_amount: Optional[float] = Field(default=0.0)
     products: List[Product]
 
-    class Config:
-        extra = "ignore"
-
 
 class OrderCreatedWebhook(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event: str
     data: OrderData
 
-    class Config:
-        extra = "ignore"
-
 
 class OrderUpdatedWebhook(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event: str
     data: OrderData
 
-    class Config:
-        extra = "ignore"
-
 
 class OrderCancelledWebhook(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event: str
     timestamp: Optional[float] = None
     data: OrderData
 
-    class Config:
-        extra = "ignore"
-
 
 class PaymentData(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     order_id: int
     amount: float
     currency: str
@@ -71,27 +67,22 @@ class PaymentData(BaseModel):
     status: str
     customer: Customer
 
-    class Config:
-        extra = "ignore"
-
 
 class PaymentSuccessfulWebhook(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event: str
     timestamp: Optional[float] = None
     data: PaymentData
 
-    class Config:
-        extra = "ignore"
-
 
 class PaymentFailedWebhook(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     event: str
     timestamp: Optional[float] = None
     data: PaymentData
 
-    class Config:
-        extra = "ignore"
-
 class WebhookResponse(BaseModel):
     message: str
     status: str = "ok"
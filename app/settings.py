@@ -1,9 +1,14 @@
-from pydantic import Field
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import FrozenSet, Literal
+from pydantic import Field, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from app.docs import get_app_description
+from app.webhooks.utils import MAX_BODY_BYTES
 
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", frozen=True)
+
     CREATE_ORDER_WEBHOOK_SECRET: str = Field(
         ...,
         description="Secret for create order webhook. "
@@ -59,15 +64,45 @@ class Settings(BaseSettings):
         description="Path for ReDoc documentation.",
         init=False
     )
+    MAX_BODY_BYTES: int = Field(
+        MAX_BODY_BYTES,
+        description="Largest webhook body accepted, in bytes. Larger requests get 413.",
+        init=False
+    )
+    LOG_LEVEL: Literal["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"] = Field(
+        "INFO",
+        description="Logging level for application and plugin loggers (case-insensitive).",
+        init=False
+    )
     PLUGIN_PATH: str = Field(
         "app.plugins",
         description="Python package path to load plugins from.",
         init=False
     )
+    SEQUENTIAL_HANDLERS: bool = Field(
+        False,
+        description="Run an event's handlers one at a time in registration order instead of concurrently.",
+        init=False
+    )
+    DISABLED_PLUGINS: str = Field(
+        "",
+        description="Comma-separated plugin module or entry-point names to skip at startup, e.g. `logger,metrics`.",
+        init=False
+    )
+
+    @field_validator("LOG_LEVEL", mode="before")
+    @classmethod
+    def _upper_log_level(cls, value):
+        """Accept level names in any case, e.g. `info`."""
+        return value.upper() if isinstance(value, str) else value
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    @property
+    def disabled_plugins(self) -> FrozenSet[str]:
+        """DISABLED_PLUGINS as a set of names, ignoring blanks and surrounding spaces."""
+        return frozenset(name.strip() for name in self.DISABLED_PLUGINS.split(",") if name.strip())
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Load settings from the environment and `.env` once per process."""
+    return Settings()
@@ -1,13 +1,20 @@
 from app.webhooks.events import events, WebhookMeta, WebhookEvents
-from app.webhooks.utils import extract_webhook_data, verify_timestamp, verify_signature
-from app.webhooks.loader import load_plugins
+from app.webhooks.utils import (
+    extract_webhook_headers,
+    verify_timestamp,
+    verify_signature,
+    verify_signature_streaming,
+)
+from app.webhooks.loader import load_plugins, load_entry_point_plugins
 
 __all__ = [
     'events',
-    'extract_webhook_data',
+    'extract_webhook_headers',
     'verify_timestamp',
     'verify_signature',
+    'verify_signature_streaming',
     'WebhookEvents',
     'WebhookMeta',
     'load_plugins',
+    'load_entry_point_plugins',
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from typing import (
     Any,
@@ -7,6 +8,7 @@ from typing import (
     Dict,
     List,
     Protocol,
+    Tuple,
     TypedDict,
 )
 
@@ -24,25 +26,60 @@ class WebhookHandler(Protocol):
 
 
 class WebhookEvents:
-    def __init__(self) -> None:
+    def __init__(self, sequential: bool = False) -> None:
         self._handlers: Dict[str, List[WebhookHandler]] = defaultdict(list)
+        self._frozen = False
+        self._resolved: Dict[str, Tuple[WebhookHandler, ...]] = {}
+        self._resolved_star: Tuple[WebhookHandler, ...] = ()
+        self.sequential = sequential
 
     def on(self, event_name: str) -> Callable[[WebhookHandler], WebhookHandler]:
         """Register a handler for a given event name."""
         def decorator(func: WebhookHandler) -> WebhookHandler:
+            if self._frozen:
+                raise RuntimeError(f"Cannot register a handler for {event_name!r} after events are frozen")
             self._handlers[event_name].append(func)
+            self._rebuild()
             return func
         return decorator
 
+    def _rebuild(self) -> None:
+        """Precompute each event's handlers followed by the "*" handlers."""
+        star = tuple(self._handlers.get("*", ()))
+        self._resolved = {
+            name: tuple(handlers) + star
+            for name, handlers in self._handlers.items()
+            if name != "*"
+        }
+        self._resolved_star = star
+
+    def freeze(self) -> None:
+        """
+        Lock the handler registry once plugins are loaded.
+        The resolved handler tuples become final and further registrations
+        raise RuntimeError.
+        """
+        self._rebuild()
+        self._frozen = True
+
     async def dispatch(self, event_name: str, payload: Any, meta: WebhookMeta) -> None:
-        """Dispatch an event to all registered handlers."""
-        meta = {**meta, "event": event_name}
+        """
+        Dispatch an event to all registered handlers.
+
+        Handlers run concurrently unless ``sequential`` is set, in which case
+        they are awaited one at a time in registration order.
 
-        for handler in self._handlers.get(event_name, []):
-            await handler(payload, meta)
+        ``meta`` is updated in place with the event name, so callers must pass
+        a fresh mapping per dispatch rather than sharing one across events.
+        """
+        meta["event"] = event_name
+        handlers = self._resolved.get(event_name, self._resolved_star)
 
-        for handler in self._handlers.get("*", []):
-            await handler(payload, meta)
+        if self.sequential:
+            for handler in handlers:
+                await handler(payload, meta)
+        else:
+            await asyncio.gather(*(handler(payload, meta) for handler in handlers))
 
 
 events = WebhookEvents()
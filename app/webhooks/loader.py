@@ -1,24 +1,109 @@
-import pkgutil
+import os
+import sys
+import logging
 import importlib
+from functools import lru_cache
+from importlib.metadata import entry_points
+from types import ModuleType
+from typing import FrozenSet, Iterable, Set, Tuple
 
-def load_plugins(package_path: str) -> None:
+PLUGIN_ENTRY_POINT_GROUP = "ghala.webhook_plugins"
+
+log = logging.getLogger(__name__)
+
+# Package paths whose plugins have all been imported.
+_LOADED: Set[str] = set()
+
+# Package paths that failed to import, so later calls skip the import machinery.
+_MISSING: Set[str] = set()
+
+
+def _import(name: str) -> ModuleType:
+    """Return an already imported module from sys.modules, importing it on a miss."""
+    return sys.modules.get(name) or importlib.import_module(name)
+
+
+def _discover(package: ModuleType) -> Tuple[str, ...]:
+    """
+    List the fully qualified plugin modules of a package with os.scandir.
+    Plugins are `.py` files and subpackages whose name is a valid identifier.
+    Names starting with "_" or "." (private modules, editor and OS metadata
+    files such as `._logger.py`) are skipped.
+    """
+    module_names = []
+    for path in package.__path__:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(("_", ".")):
+                    continue
+                if name.endswith(".py"):
+                    mod_name = name[:-3]
+                elif entry.is_dir(follow_symlinks=False) and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                    mod_name = name
+                else:
+                    continue
+                if mod_name.isidentifier():
+                    module_names.append(mod_name)
+
+    return tuple(f"{package.__name__}.{name}" for name in sorted(module_names))
+
+
+def load_plugins(package_path: str, disabled: Iterable[str] = ()) -> None:
     """
-    Dynamically import all modules in the given package path.
-    Only loads plugins marked as active (PLUGIN_ACTIVE=True or not set).
+    Dynamically import all modules in the given package path, once per process.
+    Modules listed in `disabled` or whose name starts with "_" are skipped.
 
     Args:
         package_path: Python package path as a string, e.g., "app.plugins"
+        disabled: Plugin module names to skip without importing them.
     """
+    if package_path in _LOADED or package_path in _MISSING:
+        return
+
     try:
-        package = importlib.import_module(package_path)
-    except ModuleNotFoundError:
+        package = _import(package_path)
+    except ModuleNotFoundError as e:
+        # Only a missing package (or parent package) is cached; an import
+        # error raised from inside the package is a real failure.
+        if e.name is None or not (package_path + ".").startswith(e.name + "."):
+            raise
+        log.warning("Plugin package %s not found; no plugins loaded from it.", package_path)
+        _MISSING.add(package_path)
         return
 
     if not hasattr(package, "__path__"):
         return
 
-    for _, module_name, _ in pkgutil.iter_modules(package.__path__):
-        mod = importlib.import_module(f"{package.__name__}.{module_name}")
-        active = getattr(mod, "PLUGIN_ACTIVE", True)
-        if not active:
+    disabled = frozenset(disabled)
+    for module_name in _discover(package):
+        if module_name.rpartition(".")[2] in disabled:
             continue
+
+        mod = _import(module_name)
+        if not getattr(mod, "PLUGIN_ACTIVE", True):
+            log.warning(
+                "%s: PLUGIN_ACTIVE is deprecated and does not disable the plugin; "
+                "list it in DISABLED_PLUGINS or prefix its name with '_' instead.",
+                module_name,
+            )
+
+    _LOADED.add(package_path)
+
+
+@lru_cache(maxsize=None)
+def load_entry_point_plugins(
+    group: str = PLUGIN_ENTRY_POINT_GROUP, disabled: FrozenSet[str] = frozenset()
+) -> None:
+    """
+    Import plugins that installed packages declare under the given entry-point group.
+    Discovery reads installed package metadata instead of scanning a directory,
+    and runs only once per group.
+
+    Args:
+        group: Entry-point group name, e.g., "ghala.webhook_plugins"
+        disabled: Entry-point names to skip without loading them.
+    """
+    for ep in entry_points(group=group):
+        if ep.name not in disabled:
+            ep.load()
@@ -1,51 +1,165 @@
 import time
 import hmac
-import hashlib
+import asyncio
 import base64
+from functools import lru_cache
+from typing import Optional, Tuple
 from fastapi import Request, HTTPException
 
+MAX_BODY_BYTES = 256 * 1024
+
+# Only this much of a body is hashed on the event loop; the rest goes to a worker thread.
+THREADED_SIGNATURE_BYTES = 16 * 1024
+
+TIMESTAMP_HEADERS = ("x-ghala-timestamp", "webhook-timestamp")
+SIGNATURE_HEADER = "x-ghala-signature"
+
+# Module-level aliases for the functions called on every signature check.
+_b64decode = base64.b64decode
+_compare_digest = hmac.compare_digest
+
 
 def verify_timestamp(timestamp: str, max_age_seconds: int = 300):
     """
     Check if the timestamp is within the allowed time window (default 5 minutes).
-    Supports floating-point timestamps.
+    Integer seconds are parsed directly; floating-point timestamps are
+    still accepted and truncated to whole seconds. Only ASCII timestamps are
+    valid, which lets verify_signature encode them with the ASCII codec.
     """
+    if not timestamp.isascii():
+        raise HTTPException(status_code=400, detail="Invalid timestamp")
+
     try:
-        ts = float(timestamp)
+        ts = int(timestamp)
     except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid timestamp")
+        try:
+            ts = int(float(timestamp))
+        except (ValueError, OverflowError):
+            raise HTTPException(status_code=400, detail="Invalid timestamp")
 
-    now = time.time()
+    now = time.time_ns() // 1_000_000_000
     if abs(now - ts) > max_age_seconds:
         raise HTTPException(status_code=400, detail="Stale timestamp")
 
 
+@lru_cache(maxsize=32)
+def _prepared_hmac(secret: bytes) -> hmac.HMAC:
+    """
+    Return an HMAC SHA256 object keyed with the given secret.
+    Callers must .copy() it before updating so the cached key state is reused.
+    """
+    return hmac.new(secret, None, "sha256")
+
+
+def _signed_hmac(secret: str, timestamp: str) -> hmac.HMAC:
+    """Return a fresh HMAC for the secret, already fed the "<timestamp>." prefix."""
+    mac = _prepared_hmac(secret.encode("utf-8")).copy()
+    mac.update(f"{timestamp}.".encode("ascii"))
+    return mac
+
+
+def _check_signature(mac: hmac.HMAC, signature: str):
+    """
+    Compare the finished HMAC with the base64 signature from Ghala.
+    Raises HTTPException if signature is invalid.
+    """
+    try:
+        signature_bytes = _b64decode(signature, validate=True)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid signature")
+
+    if not _compare_digest(mac.digest(), signature_bytes):
+        raise HTTPException(status_code=400, detail="Invalid signature")
+
+
 def verify_signature(secret: str, timestamp: str, body: bytes, signature: str):
     """
     Verify the HMAC SHA256 signature from Ghala.
+    The timestamp must already have passed verify_timestamp (ASCII only).
+    The base64 signature is decoded once and compared to the raw digest.
     Raises HTTPException if signature is invalid.
     """
-    signed_content = f"{timestamp}.{body.decode('utf-8')}"
-    secret_bytes = secret.encode("utf-8")
-    computed_hmac = hmac.new(secret_bytes, signed_content.encode("utf-8"), hashlib.sha256).digest()
-    expected_signature = base64.b64encode(computed_hmac).decode()
+    mac = _signed_hmac(secret, timestamp)
+    mac.update(body)
+    _check_signature(mac, signature)
 
-    if not hmac.compare_digest(signature, expected_signature):
-        raise HTTPException(status_code=400, detail="Invalid signature")
 
+async def _read_body(request: Request, max_bytes: int, mac: Optional[hmac.HMAC] = None) -> bytearray:
+    """
+    Read the request body, never buffering more than max_bytes.
+    If mac is given, chunks are fed to it as they arrive while the body stays
+    under THREADED_SIGNATURE_BYTES. Whatever is received past that point is
+    hashed in a single worker-thread call once the body is complete, where
+    OpenSSL runs without the GIL, so a large body never blocks the event loop.
+    A declared Content-Length above the limit is rejected with 413 before
+    anything is read, and the buffer is preallocated from it. Bodies without
+    the header are capped as their chunks arrive.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit():
+        if int(content_length) > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        buf = bytearray(int(content_length))
+    else:
+        buf = bytearray()
+
+    offset = hashed = 0
+    async for chunk in request.stream():
+        end = offset + len(chunk)
+        if end > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if mac is not None and hashed == offset and end < THREADED_SIGNATURE_BYTES:
+            mac.update(chunk)
+            hashed = end
+        buf[offset:end] = chunk
+        offset = end
 
-async def extract_webhook_data(request: Request):
+    if offset != len(buf):
+        del buf[offset:]
+
+    if mac is not None and hashed < offset:
+        tail = memoryview(buf)[hashed:]
+        try:
+            await asyncio.to_thread(mac.update, tail)
+        finally:
+            tail.release()
+    return buf
+
+
+def extract_webhook_headers(request: Request) -> Tuple[str, str]:
     """
-    Extract headers and body from the request, and normalize header names.
-    Returns: (timestamp, signature, body)
+    Extract the timestamp and signature headers from the request. Header
+    lookups are case-insensitive through Starlette's Headers mapping, and the
+    first non-empty TIMESTAMP_HEADERS alias wins.
+    Returns: (timestamp, signature)
     """
-    headers = {k.lower(): v for k, v in request.headers.items()}
-    body = await request.body()
+    headers = request.headers
 
-    timestamp = headers.get("x-ghala-timestamp") or headers.get("webhook-timestamp")
-    signature = headers.get("x-ghala-signature")
+    timestamp = next((value for key in TIMESTAMP_HEADERS if (value := headers.get(key))), None)
+    signature = headers.get(SIGNATURE_HEADER)
 
     if not timestamp or not signature:
         raise HTTPException(status_code=400, detail="Missing required headers")
 
-    return timestamp, signature, body
+    return timestamp, signature
+
+
+async def verify_signature_streaming(
+    secret: str,
+    timestamp: str,
+    request: Request,
+    signature: str,
+    max_bytes: int = MAX_BODY_BYTES,
+) -> bytearray:
+    """
+    Verify the HMAC SHA256 signature while the body is being received.
+    The body is read only once and hashed as described in _read_body.
+    Bodies larger than max_bytes are rejected with 413.
+    Raises HTTPException if signature is invalid.
+    Returns: the verified body as a bytearray
+    """
+    mac = _signed_hmac(secret, timestamp)
+    body = await _read_body(request, max_bytes, mac)
+    _check_signature(mac, signature)
+
+    return body